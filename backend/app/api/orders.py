@@ -4,6 +4,7 @@ Order related APIs.
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -15,16 +16,20 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
-@router.get("/report")
+@router.get("/report", response_class=ORJSONResponse)
 def get_all_orders(db: Session = Depends(get_db)):
     """
     Get all orders report with performance metrics.
 
+    The report is returned as an ORJSONResponse directly, so it is encoded
+    once by orjson instead of going through jsonable_encoder and json.dumps.
+
     Args:
         db: Database session dependency.
 
     Returns:
-        dict: Orders report with metadata including query count and execution time.
+        ORJSONResponse: Orders report with metadata including query count and
+            execution time.
 
     Raises:
         HTTPException: 500 if database error occurs.
@@ -32,7 +37,7 @@ def get_all_orders(db: Session = Depends(get_db)):
     try:
         orders_service = OrdersService(db)
         all_orders = orders_service.get_all_orders()
-        return all_orders
+        return ORJSONResponse(all_orders)
     except SQLAlchemyError as e:
         logger.error("Database error in GET orders/report: %s", e)
         raise HTTPException(
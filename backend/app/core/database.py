@@ -6,7 +6,7 @@ import os
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 
 load_dotenv()
@@ -16,7 +16,26 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set.")
 
-engine = create_engine(DATABASE_URL, echo=True)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_PREPARE_THRESHOLD = int(os.getenv("DB_PREPARE_THRESHOLD", "3"))
+
+# psycopg 3 turns a query into a server-side prepared statement once it has
+# run DB_PREPARE_THRESHOLD times on a connection, skipping parse/plan after.
+connect_args = {}
+if make_url(DATABASE_URL).get_driver_name() == "psycopg":
+    connect_args["prepare_threshold"] = DB_PREPARE_THRESHOLD
+
+engine = create_engine(
+    DATABASE_URL,
+    echo=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
+    connect_args=connect_args,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 query_count = 0
 
@@ -6,5 +6,6 @@ from .base import Base
 from .customer import Customer
 from .orders import Orders
 from .order_item import OrderItem
+from .product import Product
 
-__all__ = ["Base", "Customer", "Orders", "OrderItem"]
\ No newline at end of file
+__all__ = ["Base", "Customer", "Orders", "OrderItem", "Product"]
\ No newline at end of file
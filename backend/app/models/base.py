@@ -6,4 +6,15 @@ from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
-    pass
+    """
+    Declarative base for all models.
+
+    eager_defaults="auto" is already SQLAlchemy 2.0's default. It is spelled
+    out because the models rely on it: server-generated values such as
+    ``order_date`` and ``created_at`` come back through RETURNING on a
+    batched multi-row INSERT instead of per-row SELECTs after the flush.
+    A model that defines its own ``__mapper_args__`` replaces this dict and
+    must repeat the setting.
+    """
+
+    __mapper_args__ = {"eager_defaults": "auto"}
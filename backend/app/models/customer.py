@@ -5,7 +5,7 @@ Customer table model.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -21,10 +21,12 @@ class Customer(Base):
 
     __tablename__ = "customer"
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
-    company: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    company: Mapped[str | None] = mapped_column(
+        String(100), nullable=True, deferred=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -33,5 +35,9 @@ class Customer(Base):
         "Orders", back_populates="customer"
     )
 
+    __table_args__ = (
+        Index("idx_customer_email_hash", "email", postgresql_using="hash"),
+    )
+
     def __repr__(self) -> str:
         return f"<Customer(id={self.id}, name='{self.name}', email='{self.email}')>"
\ No newline at end of file
@@ -2,16 +2,16 @@
 Order Item table model.
 """
 
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, Numeric, String
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
 
 if TYPE_CHECKING:
     from .orders import Orders
+    from .product import Product
 
 
 class OrderItem(Base):
@@ -21,26 +21,38 @@ class OrderItem(Base):
 
     __tablename__ = "order_item"
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     order_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("orders.id", ondelete="CASCADE"),
         nullable=False,
+    )
+    product_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("product.id"),
+        nullable=False,
         index=True
     )
-    product_name: Mapped[str] = mapped_column(String(200), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
-    unit_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    unit_price: Mapped[float] = mapped_column(
+        Numeric(10, 2, asdecimal=False), nullable=False
+    )
 
     orders: Mapped["Orders"] = relationship("Orders", back_populates="items")
+    product: Mapped["Product"] = relationship("Product", back_populates="items")
 
     __table_args__ = (
         CheckConstraint("quantity > 0", name="check_positive_quantity"),
         CheckConstraint("unit_price >= 0", name="check_non_negative_price"),
+        Index(
+            "idx_order_item_order_id_covering",
+            "order_id",
+            postgresql_include=["quantity", "unit_price"],
+        ),
     )
 
     def __repr__(self) -> str:
         return (
             f"<OrderItem(id={self.id}, order_id={self.order_id}, "
-            f"product='{self.product_name}')>"
+            f"product_id={self.product_id})>"
         )
\ No newline at end of file
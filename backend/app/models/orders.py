@@ -6,13 +6,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
-    CheckConstraint,
     DateTime,
+    Enum,
+    FetchedValue,
     ForeignKey,
+    Index,
     Integer,
-    String,
+    Numeric,
     Text,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -30,7 +33,7 @@ class Orders(Base):
 
     __tablename__ = "orders"
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     customer_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("customer.id", ondelete="CASCADE"),
@@ -40,21 +43,49 @@ class Orders(Base):
     order_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
-    status: Mapped[str] = mapped_column(String(20), nullable=False)
-    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    status: Mapped[str] = mapped_column(
+        Enum(
+            "pending",
+            "processing",
+            "shipped",
+            "delivered",
+            "cancelled",
+            name="order_status",
+        ),
+        nullable=False,
+    )
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
+    # Owned by the database: the trg_order_item_totals trigger on order_item
+    # keeps these in sync, so application code must not assign them.
+    # Loaded Orders objects only see new values after they are expired.
+    item_count: Mapped[int] = mapped_column(
+        Integer,
+        server_default="0",
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
+    total: Mapped[float] = mapped_column(
+        Numeric(12, 2, asdecimal=False),
+        server_default="0",
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
 
     customer: Mapped["Customer"] = relationship(
-        "Customer", back_populates="orders"
+        "Customer", back_populates="orders", lazy="joined"
     )
     items: Mapped[list["OrderItem"]] = relationship(
-        "OrderItem", back_populates="orders"
+        "OrderItem", back_populates="orders", lazy="selectin"
     )
 
     __table_args__ = (
-        CheckConstraint(
-            "status IN ('pending', 'processing', 'shipped', 'delivered', "
-            "'cancelled')",
-            name="check_status_values"
+        Index(
+            "idx_orders_active_status",
+            "status",
+            "order_date",
+            postgresql_where=text(
+                "status IN ('pending', 'processing', 'shipped')"
+            ),
         ),
     )
 
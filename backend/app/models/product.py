@@ -0,0 +1,31 @@
+"""
+Product table model.
+"""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base
+
+if TYPE_CHECKING:
+    from .order_item import OrderItem
+
+
+class Product(Base):
+    """
+    Products table.
+    """
+
+    __tablename__ = "product"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False, unique=True)
+
+    items: Mapped[list["OrderItem"]] = relationship(
+        "OrderItem", back_populates="product"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Product(id={self.id}, name='{self.name}')>"
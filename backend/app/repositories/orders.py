@@ -1,10 +1,29 @@
 """
 Repository to handle orders table.
 """
+from collections.abc import Sequence
+
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
+from app.models.customer import Customer
 from app.models.orders import Orders
 
+# Built once at import and reused for every request, so the statement is
+# not reconstructed per call and always hits SQLAlchemy's compiled cache.
+ORDERS_REPORT_QUERY = (
+    select(
+        Orders.id.label("order_id"),
+        Customer.name.label("customer_name"),
+        Orders.item_count,
+        Orders.order_date,
+        Orders.status,
+        Orders.total,
+    )
+    .join(Customer, Orders.customer_id == Customer.id)
+    .order_by(Orders.id)
+)
+
 
 class OrdersRepository:
     """
@@ -14,13 +33,17 @@ class OrdersRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def get_all_orders(self) -> list[Orders]:
+    def get_orders_report(self) -> Sequence[RowMapping]:
         """
-        Get all orders in the database.
+        Get one report row per order.
+
+        Item count and total are read from the orders columns kept up to
+        date by a trigger on order_item, so the whole report is a single
+        scan of orders joined to customer, with no per-item aggregation
+        and no ORM objects materialized.
 
         Returns:
-            list[Orders]: All orders from the database.
+            Sequence[RowMapping]: Rows with order_id, customer_name, item_count,
+                order_date, status and total.
         """
-        return self.db.query(Orders).all()
-
-
+        return self.db.execute(ORDERS_REPORT_QUERY).mappings().all()
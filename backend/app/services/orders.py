@@ -26,26 +26,12 @@ class OrdersService:
             dict containing report data and metadata (execution time, query count)
         """
         reset_query_count()
-        start_time = time.time()
-        orders = self.orders_repository.get_all_orders()
-
-        report = [
-            {
-                "order_id": order.id,
-                "customer_name": order.customer.name,
-                "item_count": len(order.items),
-                "order_date": order.order_date,
-                "status": order.status,
-                "total": sum(
-                    item.unit_price * item.quantity
-                    for item in order.items
-                )
-            }
-            for order in orders
-        ]
+        start_time = time.perf_counter_ns()
+        rows = self.orders_repository.get_orders_report()
+        report = [dict(row) for row in rows]
 
-        end_time = time.time()
-        duration_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        duration_ms = (end_time - start_time) / 1_000_000
 
         return {
             "report": report,
@@ -3,7 +3,21 @@ pytest configuration and fixtures for integration tests.
 """
 
 import os
+import time
+
+import httpx
 import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.models import Customer, OrderItem, Orders, Product
+
+SEED_CUSTOMERS = 50
+SEED_ORDERS = 300
+SEED_ITEMS_PER_ORDER = 4
+INSERT_CHUNK_SIZE = 10_000
+STATUSES = Orders.__table__.c.status.type.enums
+HEALTH_CHECK_ATTEMPTS = 5
 
 
 @pytest.fixture(scope="session")
@@ -12,5 +26,134 @@ def api_url():
     Provides the API URL.
     When running in Docker, uses Docker network hostname.
     When running locally, uses localhost.
+
+    Probes /health once per session with exponential backoff and skips
+    API tests right away if the API never becomes ready.
+    """
+    url = os.getenv("API_URL", "http://localhost:8000")
+    for attempt in range(HEALTH_CHECK_ATTEMPTS):
+        try:
+            httpx.get(f"{url}/health", timeout=1.0).raise_for_status()
+            return url
+        except httpx.HTTPError:
+            if attempt < HEALTH_CHECK_ATTEMPTS - 1:
+                time.sleep(0.2 * 2 ** attempt)
+    pytest.skip(f"API at {url} is not ready")
+
+
+@pytest.fixture(scope="session")
+def api_client(api_url):
+    """
+    Provides one HTTP client for the whole test session.
+    Reusing it keeps the connection to the API alive between tests.
+    """
+    with httpx.Client(base_url=api_url, timeout=30.0) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Provides a SQLAlchemy engine for the test database.
+    Skips database tests when DATABASE_URL is not set.
+    """
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        pytest.skip("DATABASE_URL is not set")
+
+    engine = create_engine(database_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def db_connection(db_engine):
+    """
+    Provides one connection for the whole test session.
+    Everything written through it is rolled back at the end of the
+    session, so tests never change the seeded test data.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+def _insert_in_chunks(session, model, rows):
+    """
+    Insert rows with executemany-style batches and return their ids.
+
+    Each chunk is a single ORM bulk INSERT ... RETURNING, with ids
+    returned in the same order as the given rows.
+    """
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    ids = []
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        ids.extend(session.scalars(stmt, rows[start:start + INSERT_CHUNK_SIZE]))
+    return ids
+
+
+@pytest.fixture(scope="session")
+def seeded_orders(db_connection):
+    """
+    Bulk inserts extra products, customers, orders and order items on top
+    of the SQL seed data, so the query count test runs with several times
+    more orders than the seed alone. Kept small on purpose: every item
+    insert also fires the order totals trigger.
+
+    Returns:
+        int: Number of orders inserted.
+    """
+    session = Session(bind=db_connection, join_transaction_mode="create_savepoint")
+    try:
+        product_ids = _insert_in_chunks(session, Product, [
+            {"name": f"Seed Product {j}"}
+            for j in range(SEED_ITEMS_PER_ORDER)
+        ])
+        customer_ids = _insert_in_chunks(session, Customer, [
+            {
+                "name": f"Seed Customer {i}",
+                "email": f"seed-customer-{i}@example.com",
+                "company": None,
+            }
+            for i in range(SEED_CUSTOMERS)
+        ])
+        order_ids = _insert_in_chunks(session, Orders, [
+            {
+                "customer_id": customer_ids[i % len(customer_ids)],
+                "status": STATUSES[i % len(STATUSES)],
+                "notes": None,
+            }
+            for i in range(SEED_ORDERS)
+        ])
+        _insert_in_chunks(session, OrderItem, [
+            {
+                "order_id": order_id,
+                "product_id": product_ids[j],
+                "quantity": 1 + j,
+                "unit_price": 10.5 * (j + 1),
+            }
+            for order_id in order_ids
+            for j in range(SEED_ITEMS_PER_ORDER)
+        ])
+        session.commit()
+    finally:
+        session.close()
+
+    return len(order_ids)
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """
+    Provides a database session inside a savepoint.
+    The savepoint is rolled back after each test.
     """
-    return os.getenv("API_URL", "http://localhost:8000")
+    session = Session(bind=db_connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
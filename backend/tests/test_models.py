@@ -0,0 +1,35 @@
+"""
+Integration tests for model mapping behavior.
+Tests how the models are written to the test database.
+"""
+
+from app.models.customer import Customer
+from tests.utils import count_queries
+
+BATCH_SIZE = 100
+
+
+def test_orm_insert_is_batched_with_returning(db_session):
+    """
+    Flushing many new objects emits one batched INSERT ... RETURNING that
+    also fetches server defaults, with no per-row follow-up SELECTs.
+    """
+    customers = [
+        Customer(
+            name=f"Batch Customer {i}",
+            email=f"batch-customer-{i}@example.com",
+        )
+        for i in range(BATCH_SIZE)
+    ]
+    db_session.add_all(customers)
+
+    with count_queries(db_session.connection()) as queries:
+        db_session.flush()
+        created_at = [customer.created_at for customer in customers]
+
+    assert len(queries) == 1, f"Expected 1 INSERT, got {len(queries)} statements"
+    statement = queries[0].upper()
+    assert statement.lstrip().startswith("INSERT"), "Expected an INSERT statement"
+    assert "RETURNING" in statement, "INSERT should return generated values"
+    assert all(created_at), "created_at should be populated from RETURNING"
+    print(f"\nSUCCESS: {BATCH_SIZE} customers inserted with {len(queries)} statement")
@@ -0,0 +1,115 @@
+"""
+Integration tests for the orders repository.
+Tests the repository directly against the test database.
+"""
+
+import pytest
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import selectinload
+
+from app.models.order_item import OrderItem
+from app.models.orders import Orders
+from app.repositories.orders import OrdersRepository
+from tests.utils import count_queries
+
+
+def test_get_orders_report_query_count(db_session, seeded_orders):
+    """
+    The report is produced by a single query, regardless of how many
+    orders exist.
+    """
+    repository = OrdersRepository(db_session)
+
+    with count_queries(db_session.connection()) as queries:
+        report = repository.get_orders_report()
+
+    assert len(report) >= seeded_orders, "Should return every seeded order"
+    assert len(queries) == 1, f"Expected 1 query, got {len(queries)}"
+    print(f"\nSUCCESS: {len(report)} report rows loaded with {len(queries)} query")
+
+
+def test_get_orders_report_matches_order_items(db_session, seeded_orders):
+    """
+    Item counts and totals kept on orders by the order_item trigger match
+    the order items stored for each order.
+    """
+    repository = OrdersRepository(db_session)
+    report = repository.get_orders_report()
+
+    orders = db_session.scalars(
+        select(Orders).options(selectinload(Orders.items))
+    ).all()
+    expected = {
+        order.id: (
+            len(order.items),
+            sum(item.quantity * item.unit_price for item in order.items),
+        )
+        for order in orders
+    }
+
+    assert len(report) == len(expected), "Report should have one row per order"
+    for row in report:
+        item_count, total = expected[row["order_id"]]
+        assert row["item_count"] == item_count, f"Wrong item_count for order {row['order_id']}"
+        assert row["total"] == pytest.approx(total), f"Wrong total for order {row['order_id']}"
+
+
+def assert_order_totals_in_sync(db_session, *order_ids):
+    """
+    Asserts that item_count and total stored on each order equal a fresh
+    COUNT/SUM over its order items.
+    """
+    for order_id in order_ids:
+        stored_count, stored_total = db_session.execute(
+            select(Orders.item_count, Orders.total).where(Orders.id == order_id)
+        ).one()
+        actual_count, actual_total = db_session.execute(
+            select(
+                func.count(OrderItem.id),
+                func.coalesce(func.sum(OrderItem.quantity * OrderItem.unit_price), 0),
+            ).where(OrderItem.order_id == order_id)
+        ).one()
+        assert stored_count == actual_count, f"Wrong item_count for order {order_id}"
+        assert stored_total == pytest.approx(actual_total), f"Wrong total for order {order_id}"
+
+
+def test_order_totals_follow_item_changes(db_session):
+    """
+    The order_item trigger keeps orders.item_count and orders.total correct
+    when items are updated, moved to another order, or deleted, including
+    deletes cascaded from an order.
+    """
+    first_order_id, second_order_id = db_session.scalars(
+        select(OrderItem.order_id).distinct().order_by(OrderItem.order_id).limit(2)
+    ).all()
+    item_id = db_session.scalars(
+        select(OrderItem.id).where(OrderItem.order_id == first_order_id).limit(1)
+    ).one()
+
+    # Update quantity and unit_price
+    db_session.execute(
+        update(OrderItem)
+        .where(OrderItem.id == item_id)
+        .values(quantity=OrderItem.quantity + 3, unit_price=123.45)
+    )
+    assert_order_totals_in_sync(db_session, first_order_id)
+
+    # Move the item to another order
+    db_session.execute(
+        update(OrderItem)
+        .where(OrderItem.id == item_id)
+        .values(order_id=second_order_id)
+    )
+    assert_order_totals_in_sync(db_session, first_order_id, second_order_id)
+
+    # Delete the item
+    db_session.execute(delete(OrderItem).where(OrderItem.id == item_id))
+    assert_order_totals_in_sync(db_session, first_order_id, second_order_id)
+
+    # Delete an order, cascading to its items
+    db_session.execute(delete(Orders).where(Orders.id == first_order_id))
+    remaining_items = db_session.scalar(
+        select(func.count(OrderItem.id)).where(OrderItem.order_id == first_order_id)
+    )
+    assert remaining_items == 0, "Order items should be deleted with their order"
+    assert_order_totals_in_sync(db_session, second_order_id)
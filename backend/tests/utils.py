@@ -0,0 +1,27 @@
+"""
+Shared helpers for integration tests.
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(connection):
+    """
+    Collects every SQL statement executed on the connection inside the block.
+
+    Yields:
+        list[str]: Statements executed so far.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
@@ -28,13 +28,20 @@
           'Phone Stand', 'Laptop Sleeve', 'Power Bank', 'Ethernet Cable',
           'HDMI Cable', 'Screen Protector', 'Cleaning Kit', 'Mousepad XL'
       ];
-      statuses TEXT[] := ARRAY['pending', 'processing', 'shipped', 'delivered', 'cancelled'];
+      statuses order_status[] := enum_range(NULL::order_status);
+      product_ids INTEGER[];
       customer_id_val INTEGER;
       order_id_val INTEGER;
       items_count INTEGER;
       i INTEGER;
       j INTEGER;
   BEGIN
+      -- Generate the product catalog
+      INSERT INTO product (name)
+      SELECT unnest(products);
+
+      SELECT array_agg(id ORDER BY id) INTO product_ids FROM product;
+
       -- Generate 200 customers
       FOR i IN 1..200 LOOP
           INSERT INTO customer (name, email, company, created_at)
@@ -72,10 +79,10 @@
           items_count := 3 + (random() * 2)::INTEGER;
 
           FOR j IN 1..items_count LOOP
-              INSERT INTO order_item (order_id, product_name, quantity, unit_price)
+              INSERT INTO order_item (order_id, product_id, quantity, unit_price)
               VALUES (
                   order_id_val,
-                  products[1 + (random() * (array_length(products, 1) - 1))::INTEGER],
+                  product_ids[1 + (random() * (array_length(product_ids, 1) - 1))::INTEGER],
                   1 + (random() * 4)::INTEGER,  -- quantity 1-5
                   (10 + random() * 990)::DECIMAL(10,2)  -- price $10-$1000
               );
@@ -7,35 +7,81 @@
       created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
   );
 
+  -- Order Status Type
+  CREATE TYPE order_status AS ENUM ('pending', 'processing', 'shipped', 'delivered', 'cancelled');
+
   -- Orders Table
   CREATE TABLE IF NOT EXISTS orders (
       id SERIAL PRIMARY KEY,
       customer_id INTEGER NOT NULL,
       order_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-      status VARCHAR(20) NOT NULL CHECK (status IN ('pending', 'processing', 'shipped', 'delivered', 'cancelled')),
+      status order_status NOT NULL,
       notes TEXT,
+      item_count INTEGER NOT NULL DEFAULT 0,
+      total DECIMAL(12,2) NOT NULL DEFAULT 0,
       CONSTRAINT fk_customer
           FOREIGN KEY (customer_id)
           REFERENCES customer(id)
           ON DELETE CASCADE
   );
 
+  -- Products Table
+  CREATE TABLE IF NOT EXISTS product (
+      id SERIAL PRIMARY KEY,
+      name VARCHAR(200) NOT NULL UNIQUE
+  );
+
   -- Order Items Table
   CREATE TABLE IF NOT EXISTS order_item (
       id SERIAL PRIMARY KEY,
       order_id INTEGER NOT NULL,
-      product_name VARCHAR(200) NOT NULL,
+      product_id INTEGER NOT NULL,
       quantity INTEGER NOT NULL CHECK (quantity > 0),
       unit_price DECIMAL(10,2) NOT NULL CHECK (unit_price >= 0),
       CONSTRAINT fk_order
           FOREIGN KEY (order_id)
           REFERENCES orders(id)
-          ON DELETE CASCADE
+          ON DELETE CASCADE,
+      CONSTRAINT fk_product
+          FOREIGN KEY (product_id)
+          REFERENCES product(id)
   );
 
+  -- Keep orders.item_count and orders.total in sync with order_item
+  CREATE OR REPLACE FUNCTION update_order_totals() RETURNS TRIGGER AS $$
+  BEGIN
+      IF TG_OP IN ('UPDATE', 'DELETE') THEN
+          UPDATE orders
+          SET item_count = item_count - 1,
+              total = total - OLD.quantity * OLD.unit_price
+          WHERE id = OLD.order_id;
+      END IF;
+
+      IF TG_OP IN ('INSERT', 'UPDATE') THEN
+          UPDATE orders
+          SET item_count = item_count + 1,
+              total = total + NEW.quantity * NEW.unit_price
+          WHERE id = NEW.order_id;
+      END IF;
+
+      RETURN NULL;
+  END;
+  $$ LANGUAGE plpgsql;
+
+  CREATE TRIGGER trg_order_item_totals
+      AFTER INSERT OR DELETE OR UPDATE OF order_id, quantity, unit_price ON order_item
+      FOR EACH ROW EXECUTE FUNCTION update_order_totals();
+
   -- Indexes for foreign keys (standard practice)
   CREATE INDEX idx_order_customer_id ON orders(customer_id);
-  CREATE INDEX idx_order_item_order_id ON order_item(order_id);
+  CREATE INDEX idx_order_item_product_id ON order_item(product_id);
+
+  -- Partial index for reports filtered on active (not yet delivered or cancelled) orders
+  CREATE INDEX idx_orders_active_status ON orders(status, order_date)
+      WHERE status IN ('pending', 'processing', 'shipped');
+
+  -- Covering index for per-order item aggregation (also serves the order_id foreign key)
+  CREATE INDEX idx_order_item_order_id_covering ON order_item(order_id) INCLUDE (quantity, unit_price);
 
-  -- Index for email lookups
-  CREATE INDEX idx_customer_email ON customer(email);
+  -- Hash index for exact-match email lookups (uniqueness is enforced by the UNIQUE constraint)
+  CREATE INDEX idx_customer_email_hash ON customer USING hash (email);